@@ -5,25 +5,27 @@ with accessibility features and automatic screen reader detection.
 """
 
 import argparse
+import functools
 import json
 import os
+import pickle
 import platform
+import shutil
 import subprocess
 import sys
+import textwrap
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, List, Tuple, Union
 
-# Fix Windows console encoding issues
+# Fix Windows console encoding issues; reconfigure keeps the native
+# buffered writer instead of layering a Python-level codec per print
 if sys.platform == "win32":
-    import codecs
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.detach())
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
-import keyring
-import psutil
-from dotenv import load_dotenv
-from PIL import Image, ImageDraw, ImageFont
-from openai import OpenAI
+# Heavy third-party modules (PIL, openai, keyring, psutil, dotenv, numpy)
+# are imported lazily inside the methods that need them, so --help and
+# single-purpose invocations don't pay the full import cost up front.
 
 # For secure input
 try:
@@ -31,6 +33,105 @@ try:
 except ImportError:
     getpass = None
 
+# platform.system() can be expensive on some platforms; resolve it once
+_SYSTEM = platform.system()
+
+# Known screen reader process names per platform, lowercased for matching
+_SCREEN_READERS_LINUX = {'orca', 'speech-dispatcher'}
+_SCREEN_READERS_WINDOWS = {'nvda.exe', 'jfw.exe', 'jaws.exe', 'narrator.exe'}
+
+# Marker for "not detected yet" (None is a valid detection result)
+_SENTINEL = object()
+
+# orjson parses and serializes config noticeably faster; fall back to stdlib
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a config file once per (path, mtime) across instances."""
+    return _json_loads(Path(path).read_bytes())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_numba_kernel():
+    """Build the JIT pixel-to-ASCII kernel, or None if numba is unavailable."""
+    try:
+        import numba
+        import numpy as np
+    except ImportError:
+        return None
+
+    @numba.njit(parallel=True, cache=True)
+    def kernel(pixels, lut, width):
+        height = pixels.shape[0] // width
+        out = np.empty(pixels.shape[0] + height, np.uint8)
+        for r in numba.prange(height):
+            src = r * width
+            dst = r * (width + 1)
+            for c in range(width):
+                out[dst + c] = lut[pixels[src + c]]
+            out[dst + width] = 0x0A
+        return out
+
+    return kernel
+
+
+@functools.lru_cache(maxsize=32)
+def _get_font(name: str, size: int):
+    """Load a font once per (name, size) and reuse it across conversions."""
+    from PIL import ImageFont
+    try:
+        return ImageFont.truetype(name, size)
+    except OSError:
+        # Fallback to default font
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_font_metrics(name: str, size: int) -> Tuple[int, int]:
+    """Measure the monospace cell (width, bare height) once per font."""
+    font = _get_font(name, size)
+    return int(round(font.getlength('M'))), font.getbbox('Ag')[3]
+
+
+@functools.lru_cache(maxsize=8)
+def _get_glyph_atlas(font_name: str, font_size: int, fg_color: str,
+                     bg_color: str, spacing: int):
+    """Rasterize each printable ASCII glyph once into a NumPy tile atlas.
+
+    Rendering then becomes array indexing plus memcpy instead of one
+    FreeType pass per character.
+    """
+    import numpy as np
+    from PIL import Image, ImageDraw
+
+    font = _get_font(font_name, font_size)
+    cell_w, bare_h = _get_font_metrics(font_name, font_size)
+    cell_h = bare_h + spacing
+
+    atlas = np.empty((128, cell_h, cell_w, 3), dtype=np.uint8)
+    for code in range(128):
+        tile = Image.new('RGB', (cell_w, cell_h), bg_color)
+        if 32 < code < 127:
+            ImageDraw.Draw(tile).text((0, 0), chr(code), font=font, fill=fg_color)
+        atlas[code] = np.asarray(tile)
+
+    return atlas, cell_w, cell_h
+
 
 class AsciiVision:
     """Main AsciiVision application class."""
@@ -38,16 +139,24 @@ class AsciiVision:
     def __init__(self):
         self.config_dir = self._get_config_dir()
         self.config_file = self.config_dir / "config.json"
-        self.config = self._load_config()
+        self.config_pickle = self.config_dir / "config.pkl"
+        self._config = None
         self.client = None
+        self._screen_reader_cache = _SENTINEL
+        self._environment_cache = None
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration dict, loaded from disk on first access."""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
         
     def _get_config_dir(self) -> Path:
         """Get the appropriate config directory for the current OS."""
-        system = platform.system()
-        
-        if system == "Windows":
+        if _SYSTEM == "Windows":
             config_dir = Path(os.environ.get("APPDATA", "")) / "AsciiVision"
-        elif system == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             config_dir = Path.home() / "Library" / "Application Support" / "AsciiVision"
         else:  # Linux and others
             config_dir = Path.home() / ".config" / "asciivision"
@@ -63,58 +172,100 @@ class AsciiVision:
             "model": "gpt-4o"
         }
         
-        if self.config_file.exists():
+        # Prefer the binary snapshot when it is at least as new as the
+        # human-editable JSON; unpickling skips text tokenization entirely
+        try:
+            pkl_mtime = os.path.getmtime(self.config_pickle)
             try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    return {**default_config, **config}
-            except (json.JSONDecodeError, IOError):
-                pass
-                
+                json_mtime = os.path.getmtime(self.config_file)
+            except OSError:
+                json_mtime = 0
+            if pkl_mtime >= json_mtime:
+                config = pickle.loads(self.config_pickle.read_bytes())
+                return {**default_config, **config}
+        except Exception:
+            # A truncated, corrupt or non-dict snapshot (EOFError,
+            # UnpicklingError, TypeError, ...) falls through to the
+            # JSON/default path, matching the old corrupt-config behavior
+            pass
+
+        try:
+            # Keyed by mtime so repeat constructions reuse the parsed dict
+            # while edits on disk still invalidate it
+            mtime = os.path.getmtime(self.config_file)
+            config = _load_config_cached(str(self.config_file), mtime)
+            return {**default_config, **config}
+        except (ValueError, IOError, OSError):
+            pass
+
         return default_config
     
     def _save_config(self):
         """Save configuration to file."""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # JSON first so users can still read and edit it, then the
+            # pickle snapshot (written last so it is never the older copy)
+            with open(self.config_file, 'wb') as f:
+                f.write(_json_dumps(self.config))
+            with open(self.config_pickle, 'wb') as f:
+                pickle.dump(self.config, f, protocol=5)
         except IOError as e:
             print(f"Warning: Could not save config: {e}")
     
     def _detect_environment(self) -> str:
         """Detect if running in container, CI/CD, or headless environment."""
-        # Check for container
-        if Path("/.dockerenv").exists():
-            return "container"
-            
-        # Check for CI/CD environment
-        if os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS"):
-            return "ci"
-            
-        # Check for headless (no display)
-        if platform.system() != "Windows" and not os.environ.get("DISPLAY"):
-            return "headless"
-            
-        return "desktop"
+        # The answer never changes within a run, so cache it; check cheap
+        # env-var lookups before the filesystem probe
+        if self._environment_cache is None:
+            # Check for CI/CD environment
+            if os.environ.get("CI") or os.environ.get("GITHUB_ACTIONS"):
+                self._environment_cache = "ci"
+            # Check for container
+            elif os.environ.get("container") or Path("/.dockerenv").exists():
+                self._environment_cache = "container"
+            # Check for headless (no display)
+            elif sys.platform != "win32" and not os.environ.get("DISPLAY"):
+                self._environment_cache = "headless"
+            else:
+                self._environment_cache = "desktop"
+
+        return self._environment_cache
     
     def _detect_screen_reader(self) -> Optional[str]:
-        """Detect if a screen reader is running."""
-        system = platform.system()
-        
-        if system == "Linux":
+        """Detect if a screen reader is running (cached per instance)."""
+        if self._screen_reader_cache is _SENTINEL:
+            self._screen_reader_cache = self._scan_for_screen_reader()
+        return self._screen_reader_cache
+
+    def clear_screen_reader_cache(self):
+        """Forget the cached detection result so the next call rescans."""
+        self._screen_reader_cache = _SENTINEL
+
+    def _scan_for_screen_reader(self) -> Optional[str]:
+        """Walk the process table looking for a known screen reader."""
+        import psutil
+
+        # psutil 6+ caches Process objects inside process_iter; drop stale
+        # entries so the scan reflects the current process table
+        cache_clear = getattr(psutil.process_iter, 'cache_clear', None)
+        if cache_clear is not None:
+            cache_clear()
+
+        if _SYSTEM == "Linux":
             # Check for Orca, speech-dispatcher, or DBus service
-            for proc in psutil.process_iter(['name', 'cmdline']):
-                try:
-                    name = proc.info['name'].lower()
-                    if any(sr in name for sr in ['orca', 'speech-dispatcher']):
-                        return "Orca"
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-                    
-            # Check DBus service
+            for proc in psutil.process_iter(['name']):
+                name = (proc.info['name'] or '').lower()
+                if name in _SCREEN_READERS_LINUX:
+                    return "Orca"
+
+            # Check DBus service, but only where the probe can succeed:
+            # without a session bus or dbus-send the fork/exec is wasted
+            if "DBUS_SESSION_BUS_ADDRESS" not in os.environ or not shutil.which("dbus-send"):
+                return None
+
             try:
-                result = subprocess.run(['dbus-send', '--session', '--dest=org.gnome.Orca', 
-                                      '--type=method_call', '--print-reply', 
+                result = subprocess.run(['dbus-send', '--session', '--dest=org.gnome.Orca',
+                                      '--type=method_call', '--print-reply',
                                       '/org/gnome/Orca', 'org.gnome.Orca.GetVersion'],
                                      capture_output=True, timeout=2)
                 if result.returncode == 0:
@@ -122,25 +273,23 @@ class AsciiVision:
             except (subprocess.TimeoutExpired, FileNotFoundError):
                 pass
                 
-        elif system == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             # Check for VoiceOver
             for proc in psutil.process_iter(['name']):
-                try:
-                    if proc.info['name'] == "VoiceOver":
-                        return "VoiceOver"
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-                    
-        elif system == "Windows":
-            # Check for NVDA, JAWS
+                if proc.info['name'] == "VoiceOver":
+                    return "VoiceOver"
+
+        elif _SYSTEM == "Windows":
+            # Check for NVDA, JAWS, Narrator
             for proc in psutil.process_iter(['name']):
-                try:
-                    name = proc.info['name'].lower()
-                    if name in ['nvda.exe', 'jfw.exe', 'jaws.exe']:
-                        return "NVDA" if name == 'nvda.exe' else "JAWS"
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-                    
+                name = (proc.info['name'] or '').lower()
+                if name in _SCREEN_READERS_WINDOWS:
+                    if name == 'nvda.exe':
+                        return "NVDA"
+                    if name == 'narrator.exe':
+                        return "Narrator"
+                    return "JAWS"
+
         return None
     
     def _get_api_key(self) -> Optional[str]:
@@ -149,13 +298,15 @@ class AsciiVision:
         environment = self._detect_environment()
         if environment == "desktop":
             try:
+                import keyring
                 key = keyring.get_password("asciivision", "openai_api_key")
                 if key:
                     return key
             except Exception:
                 pass
-        
+
         # Fallback to .env file
+        from dotenv import load_dotenv
         load_dotenv()
         return os.getenv("OPENAI_API_KEY")
     
@@ -171,7 +322,8 @@ class AsciiVision:
             
             # Save the API key securely
             self._save_api_key(api_key)
-            
+
+        from openai import OpenAI
         self.client = OpenAI(api_key=api_key)
         return True
     
@@ -182,6 +334,7 @@ class AsciiVision:
         # Try keyring first (unless in container/CI/headless)
         if environment == "desktop":
             try:
+                import keyring
                 keyring.set_password("asciivision", "openai_api_key", api_key)
                 print("✓ API key saved securely to keyring!")
                 return
@@ -276,32 +429,39 @@ class AsciiVision:
         
         try:
             import base64
-            
+            import io
+
+            # Chat-completions vision only accepts http(s) or data URLs
+            # for the image, so a base64 data URL is the only transport
+            # for local files; stream-encode so the raw image bytes never
+            # sit in memory alongside the encoded copy
+            buf = io.BytesIO()
             with open(image_path, "rb") as image_file:
-                image_data = base64.b64encode(image_file.read()).decode('utf-8')
-                
-                response = self.client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {
-                            "role": "user",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": "This is ASCII art converted to an image. Please describe it for someone who is visually impaired. Your description should help them understand what the ASCII art represents:\n\n1. **If it contains text**: Read the letters/words clearly and spell them out\n2. **If it's an object/scene**: Describe what it shows in detail\n3. **Character details**: Explain what specific ASCII characters are used (like | for lines, o for eyes, ^ for ears, etc.)\n4. **Layout and structure**: Describe how the characters are arranged\n\nFocus on being descriptive and helpful for someone who cannot see the image. Be specific about the visual elements and what they represent."
-                                },
-                                {
-                                    "type": "image_url",
-                                    "image_url": {
-                                        "url": f"data:image/png;base64,{image_data}"
-                                    }
+                base64.encode(image_file, buf)
+            image_data = buf.getvalue().decode('ascii').replace('\n', '')
+
+            response = self.client.chat.completions.create(
+                model=model,
+                messages=[
+                    {
+                        "role": "user",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": "This is ASCII art converted to an image. Please describe it for someone who is visually impaired. Your description should help them understand what the ASCII art represents:\n\n1. **If it contains text**: Read the letters/words clearly and spell them out\n2. **If it's an object/scene**: Describe what it shows in detail\n3. **Character details**: Explain what specific ASCII characters are used (like | for lines, o for eyes, ^ for ears, etc.)\n4. **Layout and structure**: Describe how the characters are arranged\n\nFocus on being descriptive and helpful for someone who cannot see the image. Be specific about the visual elements and what they represent."
+                            },
+                            {
+                                "type": "image_url",
+                                "image_url": {
+                                    "url": f"data:image/png;base64,{image_data}"
                                 }
-                            ]
-                        }
-                    ],
-                    max_tokens=300
-                )
-                
+                            }
+                        ]
+                    }
+                ],
+                max_tokens=300
+            )
+
             return response.choices[0].message.content
             
         except Exception as e:
@@ -313,102 +473,228 @@ class AsciiVision:
                 print(f"Error generating description: {error_msg}")
             return None
     
-    def ascii_to_image(self, ascii_text: str, output_path: str, 
+    def warmup(self):
+        """Prime the lazy caches (PIL import, fonts, optional JIT kernel).
+
+        Useful before timed or batch work so the first real conversion
+        does not pay import, font-parse or JIT-compile latency.
+        """
+        import io
+        from PIL import Image
+
+        # A tiny conversion touches the PIL pipeline and font caches
+        buf = io.BytesIO()
+        Image.new('L', (4, 4)).save(buf, format='PNG')
+        buf.seek(0)
+        self.image_to_ascii(buf, width=4)
+        _get_font("Courier", 12)
+
+        # Force the numba compile now; cache=True persists it on disk
+        kernel = _get_numba_kernel()
+        if kernel is not None:
+            import numpy as np
+            kernel(np.zeros(16, dtype=np.uint8), np.zeros(256, dtype=np.uint8), 4)
+
+    def ascii_to_image(self, ascii_text: Union[str, List[str]], output_path: str,
                       font_name: str = "Courier", font_size: int = 12,
                       bg_color: str = "white", fg_color: str = "black",
                       padding: int = 20, spacing: int = 1,
-                      antialias: bool = True, wrap_width: int = 80) -> bool:
-        """Convert ASCII text to image."""
+                      antialias: bool = True, wrap_width: int = 80,
+                      compress_level: int = 6) -> Optional[Path]:
+        """Convert ASCII text to image.
+
+        Returns the destination (a Path for path sinks, the file object
+        otherwise) on success, or None on failure — callers don't need a
+        follow-up stat to confirm the file landed.
+        """
+        # Tokenize once up front; the line-based renderer does the rest
+        if isinstance(ascii_text, str):
+            lines = ascii_text.split('\n')
+        else:
+            lines = list(ascii_text)
+
+        return self.ascii_to_image_lines(
+            lines, output_path,
+            font_name=font_name, font_size=font_size,
+            bg_color=bg_color, fg_color=fg_color,
+            padding=padding, spacing=spacing,
+            antialias=antialias, wrap_width=wrap_width,
+            compress_level=compress_level)
+
+    def ascii_to_image_lines(self, lines: List[str], output_path: str,
+                            font_name: str = "Courier", font_size: int = 12,
+                            bg_color: str = "white", fg_color: str = "black",
+                            padding: int = 20, spacing: int = 1,
+                            antialias: bool = True, wrap_width: int = 80,
+                            compress_level: int = 6) -> Optional[Path]:
+        """Render pre-split ASCII lines to an image (low-level API)."""
+        from PIL import Image, ImageDraw
+
         try:
-            # Wrap text if needed
+            # Wrap text if needed; lines that already fit pass through
+            # untouched so ASCII art keeps its leading whitespace
             if wrap_width > 0:
-                lines = []
-                for line in ascii_text.split('\n'):
+                wrapped = []
+                for line in lines:
                     if len(line) <= wrap_width:
-                        lines.append(line)
+                        wrapped.append(line)
                     else:
-                        # Simple word wrapping
-                        words = line.split()
-                        current_line = ""
-                        for word in words:
-                            if len(current_line + word) <= wrap_width:
-                                current_line += word + " "
-                            else:
-                                if current_line:
-                                    lines.append(current_line.rstrip())
-                                current_line = word + " "
-                        if current_line:
-                            lines.append(current_line.rstrip())
-                ascii_text = '\n'.join(lines)
-            
+                        wrapped.extend(textwrap.wrap(line, wrap_width) or [''])
+                lines = wrapped
+
             # Calculate image dimensions
-            lines = ascii_text.split('\n')
             max_width = max(len(line) for line in lines) if lines else 0
             
-            # Load font
-            try:
-                font = ImageFont.truetype(font_name, font_size)
-            except OSError:
-                # Fallback to default font
-                font = ImageFont.load_default()
-            
-            # Get text dimensions
-            bbox = font.getbbox(ascii_text)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
+            # Load font (cached across calls)
+            font = _get_font(font_name, font_size)
             
-            # Calculate image size with padding
-            img_width = text_width + (padding * 2)
-            img_height = text_height + (padding * 2)
-            
-            # Create image
-            image = Image.new('RGB', (img_width, img_height), bg_color)
-            draw = ImageDraw.Draw(image)
-            
-            # Draw text
-            draw.text((padding, padding), ascii_text, font=font, fill=fg_color)
-            
-            # Save image
-            image.save(output_path)
-            return True
+            # Size the canvas from cached single-character metrics rather
+            # than measuring the whole block; ASCII art wants a monospace
+            # font, so cell width times columns is exact
+            char_width, bare_height = _get_font_metrics(font_name, font_size)
+            line_height = bare_height + spacing
+            img_width = char_width * max_width + (padding * 2)
+            img_height = line_height * len(lines) + (padding * 2)
+
+            # Render via the glyph atlas when NumPy is available: each
+            # character becomes a tile copy rather than a FreeType call
+            try:
+                import numpy as np
+            except ImportError:
+                np = None
+
+            if np is not None and char_width > 0:
+                from PIL import ImageColor
+
+                atlas, cell_w, cell_h = _get_glyph_atlas(
+                    font_name, font_size, fg_color, bg_color, spacing)
+                canvas = np.empty((img_height, img_width, 3), dtype=np.uint8)
+                canvas[:] = ImageColor.getrgb(bg_color)[:3]
+
+                for y, line in enumerate(lines):
+                    if not line:
+                        continue
+                    codes = np.frombuffer(line.encode('ascii', 'replace'), dtype=np.uint8)
+                    block = atlas[codes].transpose(1, 0, 2, 3).reshape(
+                        cell_h, codes.size * cell_w, 3)
+                    top = padding + y * cell_h
+                    canvas[top:top + cell_h, padding:padding + codes.size * cell_w] = block
+
+                image = Image.fromarray(canvas)
+            else:
+                # Create image
+                image = Image.new('RGB', (img_width, img_height), bg_color)
+                draw = ImageDraw.Draw(image)
+
+                # Draw text (joined only for this path)
+                draw.multiline_text((padding, padding), '\n'.join(lines), font=font,
+                                    fill=fg_color, spacing=spacing)
             
+            # Save image; the sink may be a path or any file-like object.
+            # For PNG the zlib level is tunable (level 1 is several times
+            # cheaper than the default 6 for throwaway output)
+            if isinstance(output_path, (str, os.PathLike)):
+                if str(output_path).lower().endswith('.png'):
+                    image.save(output_path, optimize=False, compress_level=compress_level)
+                else:
+                    image.save(output_path)
+                return Path(output_path)
+
+            # Pillow cannot infer a format for file-like sinks
+            image.save(output_path, 'PNG', optimize=False, compress_level=compress_level)
+            return output_path
+
         except Exception as e:
             print(f"Error converting ASCII to image: {e}")
-            return False
+            return None
     
-    def image_to_ascii(self, image_path: str, width: int = 100) -> str:
-        """Convert image to ASCII art."""
+    def image_to_ascii(self, image_path: str, width: int = 100,
+                       resample=None, edges: bool = False,
+                       edge_threshold: int = 96) -> str:
+        """Convert image to ASCII art.
+
+        image_path may be a filesystem path or a binary file-like object.
+        resample picks the PIL downsampling filter (default BILINEAR);
+        Image.Resampling.NEAREST is cheapest for synthetic block images.
+        With edges=True (requires NumPy), cells on strong gradients are
+        drawn with directional characters instead of brightness.
+        """
+        from PIL import Image
+
+        # NumPy accelerates the conversion but is optional
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
         try:
             # ASCII characters ordered by brightness
             ascii_chars = "@%#*+=-:. "
             
             # Load and process image
             image = Image.open(image_path)
-            
-            # Convert to grayscale
-            image = image.convert('L')
-            
+
             # Calculate new dimensions preserving aspect ratio
             aspect_ratio = image.height / image.width
             height = int(width * aspect_ratio * 0.55)  # Adjust for character aspect ratio
+
+            # For JPEGs, draft() grayscales and downscales during decode;
+            # for other formats it is a no-op
+            image.draft('L', (width, height))
+
+            # Convert to grayscale and resize; at ASCII resolution BILINEAR
+            # is indistinguishable from LANCZOS and several times cheaper
+            if resample is None:
+                resample = Image.Resampling.BILINEAR
+            image = image.convert('L').resize((width, height), resample)
             
-            # Resize image
-            image = image.resize((width, height), Image.Resampling.LANCZOS)
-            
-            # Convert to ASCII
-            pixels = image.getdata()
-            ascii_text = ""
-            
-            for i, pixel in enumerate(pixels):
-                # Map pixel brightness to ASCII character
-                char_index = int((pixel / 255) * (len(ascii_chars) - 1))
-                ascii_text += ascii_chars[char_index]
-                
-                # Add newline at end of each row
-                if (i + 1) % width == 0:
-                    ascii_text += '\n'
-            
-            return ascii_text
+            # Convert to ASCII: map brightness to character indices in one
+            # vectorized pass instead of looping over pixels in Python
+            if np is not None:
+                arr = np.asarray(image, dtype=np.uint8)
+
+                # Very large images additionally go through the optional
+                # numba kernel, which parallelizes across rows
+                if not edges and arr.size >= 1_000_000:
+                    kernel = _get_numba_kernel()
+                    if kernel is not None:
+                        table = ascii_chars.encode('ascii')
+                        lut = np.array([table[(i * (len(ascii_chars) - 1)) // 255]
+                                        for i in range(256)], dtype=np.uint8)
+                        out = kernel(arr.reshape(-1), lut, width)
+                        return out.tobytes().decode('ascii')
+
+                idx = (arr.astype(np.uint32) * (len(ascii_chars) - 1)) // 255
+                chars = np.frombuffer(ascii_chars.encode('ascii'), dtype='|S1')[idx]
+
+                if edges:
+                    # Overlay directional characters where the gradient is
+                    # strong; two vectorized difference passes, no per-pixel
+                    # Python work
+                    gy, gx = np.gradient(arr.astype(np.float32))
+                    mag = np.hypot(gx, gy)
+                    # The gradient is perpendicular to the edge: a purely
+                    # horizontal gradient means a vertical stroke, and with
+                    # y pointing down a 45-degree gradient means a '/' edge
+                    ang = np.degrees(np.arctan2(gy, gx)) % 180.0
+                    bins = (((ang + 22.5) // 45).astype(np.intp)) % 4
+                    dir_chars = np.frombuffer(b'|/-\\', dtype='|S1')
+                    mask = mag > edge_threshold
+                    chars[mask] = dir_chars[bins[mask]]
+
+                rows = [chars[r].tobytes().decode('ascii') for r in range(height)]
+                return '\n'.join(rows) + '\n'
+
+            # Fallback without NumPy: quantize brightness to character
+            # indices with PIL's C-level 256-entry LUT, then translate the
+            # whole index buffer to characters in a single C pass
+            n = len(ascii_chars)
+            lut = [(i * (n - 1)) // 255 for i in range(256)]
+            data = image.point(lut).tobytes()
+            trans = bytes.maketrans(bytes(range(n)), ascii_chars.encode('ascii'))
+            body = data.translate(trans)
+            rows = [body[i:i + width].decode('ascii') for i in range(0, len(body), width)]
+            return '\n'.join(rows) + '\n'
             
         except Exception as e:
             print(f"Error converting image to ASCII: {e}")
@@ -448,8 +734,10 @@ Examples:
     parser.add_argument('--wrap', type=int, default=80, help='Wrap width (default: 80)')
     
     # Image to ASCII options
-    parser.add_argument('-w', '--width', type=int, default=100, 
+    parser.add_argument('-w', '--width', type=int, default=100,
                        help='ASCII width in characters (default: 100)')
+    parser.add_argument('--edges', action='store_true',
+                       help='Overlay directional edge characters (requires numpy)')
     
     # Description options
     parser.add_argument('-d', '--auto-describe', action='store_true',
@@ -499,7 +787,7 @@ Examples:
     # Perform conversion
     if args.to_ascii:
         # Image to ASCII
-        ascii_text = app.image_to_ascii(args.input, args.width)
+        ascii_text = app.image_to_ascii(args.input, args.width, edges=args.edges)
         if ascii_text:
             if args.output:
                 with open(args.output, 'w', encoding='utf-8') as f:
@@ -7,11 +7,11 @@ import os
 import sys
 from pathlib import Path
 
-# Fix Windows console encoding issues
+# Fix Windows console encoding issues; reconfigure keeps the native
+# buffered writer instead of layering a Python-level codec per print
 if sys.platform == "win32":
-    import codecs
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.detach())
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
 
 # Add the parent directory to the path so we can import asciivision
 sys.path.insert(0, str(Path(__file__).parent.parent))